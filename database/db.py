@@ -1,34 +1,149 @@
 """Database helper module for MySQL operations."""
 
-import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, InterfaceError, OperationalError, pooling
 
 class DatabaseHelper:
     """Handle database connections and operations."""
-    
-    def __init__(self, host="localhost", user="root", password="", database="hotel_management"):
-        """Initialize database connection parameters."""
+
+    # Pools shared across instances, keyed by connection settings and
+    # created lazily on the first connect() for those settings.
+    _pools = {}
+
+    def __init__(self, host="localhost", user="root", password="", database="hotel_management", pool_size=1):
+        """Initialize database connection parameters.
+
+        The pool opens all ``pool_size`` connections up front; the app keeps
+        a single helper, so one connection is enough by default.
+        """
+        if not 1 <= pool_size <= pooling.CNX_POOL_MAXSIZE:
+            raise ValueError(
+                f"pool_size must be between 1 and {pooling.CNX_POOL_MAXSIZE}, got {pool_size}"
+            )
         self.host = host
         self.user = user
         self.password = password
         self.database = database
+        self.pool_size = pool_size
         self.connection = None
-    
+        self._connected = False
+        # (connection id, statement) -> prepared cursor, reused across calls
+        self._cursors = {}
+
     def connect(self):
-        """Establish database connection."""
+        """Check out a connection from the shared connection pool."""
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
+            key = (self.host, self.user, self.password, self.database, self.pool_size)
+            pool = DatabaseHelper._pools.get(key)
+            if pool is None:
+                pool = pooling.MySQLConnectionPool(
+                    pool_name=f"hotel{len(DatabaseHelper._pools)}",
+                    pool_size=self.pool_size,
+                    host=self.host,
+                    user=self.user,
+                    password=self.password,
+                    database=self.database,
+                    # Each statement is its own transaction, so reads never
+                    # hold a stale snapshot or a metadata lock on the table.
+                    autocommit=True
+                )
+                DatabaseHelper._pools[key] = pool
+            self.connection = pool.get_connection()
+            self._connected = True
             return True
         except Error as e:
             print(f"Error connecting to database: {e}")
             return False
-    
+
     def disconnect(self):
-        """Close database connection."""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
+        """Return the pooled connection to the pool.
+
+        ``close()`` is what puts a pooled connection back in the queue, so
+        it is always called, even on a dead link; the pool reconnects stale
+        connections on the next checkout.
+        """
+        # Returning to the pool resets the session, which deallocates the
+        # server-side statements, so the cached cursors are simply dropped.
+        self._cursors.clear()
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Error as e:
+                print(f"Error closing database connection: {e}")
+        self.connection = None
+        self._connected = False
+
+    def _ensure_connected(self):
+        """Re-establish the link if a previous call lost it.
+
+        Cached prepared cursors are closed and dropped here rather than
+        after each failed statement; if the link turns out to be alive,
+        closing them frees their server-side statements.
+        """
+        if self._connected:
+            return True
+        for cursor in self._cursors.values():
+            try:
+                cursor.close()
+            except Error:
+                pass
+        self._cursors.clear()
+        if self.connection is None:
+            return self.connect()
+        try:
+            self.connection.ping(reconnect=True)
+        except Error as e:
+            print(f"Error reconnecting to database: {e}")
+            return False
+        self._connected = True
+        return True
+
+    def _prepared_cursor(self, query):
+        """Return a prepared cursor for ``query`` on the current connection."""
+        key = (self.connection.connection_id, query)
+        cursor = self._cursors.get(key)
+        if cursor is None:
+            cursor = self.connection.cursor(prepared=True)
+            self._cursors[key] = cursor
+        return cursor
+
+    def fetch_one(self, query, params=()):
+        """Run a SELECT and return the first row, or None."""
+        if not self._ensure_connected():
+            return None
+        try:
+            cursor = self._prepared_cursor(query)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            return rows[0] if rows else None
+        except Error as e:
+            if isinstance(e, (OperationalError, InterfaceError)):
+                # The link may have dropped; re-ping on the next call.
+                self._connected = False
+            print(f"Error executing query: {e}")
+            return None
+
+    def execute(self, query, params=(), prepared=True):
+        """Run a write statement; the pool's autocommit applies it at once.
+
+        Pass ``prepared=False`` for one-off statements such as DDL so they
+        run on a plain cursor instead of a cached server-side statement.
+        """
+        if not self._ensure_connected():
+            return False
+        cursor = None
+        try:
+            if prepared:
+                self._prepared_cursor(query).execute(query, params)
+            else:
+                cursor = self.connection.cursor()
+                cursor.execute(query, params)
+            return True
+        except Error as e:
+            if isinstance(e, (OperationalError, InterfaceError)):
+                # The link may have dropped; re-ping on the next call.
+                self._connected = False
+            print(f"Error executing query: {e}")
+            return False
+        finally:
+            if cursor is not None:
+                cursor.close()
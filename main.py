@@ -1,13 +1,23 @@
 """Main entry point for Hotel Management System."""
 
 import tkinter as tk
-from ui.auth import LoginWindow
+from ui.auth import open_auth_window
 
 def main():
     """Initialize and run the hotel management system."""
     root = tk.Tk()
     root.withdraw()  # Hide main window
-    LoginWindow(root)
+
+    def on_login(username):
+        # Imported on demand so the dashboard is not loaded before sign-in
+        from ui.dashboard import open_dashboard
+        open_dashboard(
+            root,
+            username=username,
+            on_logout=lambda: open_auth_window(root, on_success=on_login),
+        )
+
+    open_auth_window(root, on_success=on_login)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -5,16 +5,46 @@ Tkinter Toplevel window. It integrates with the MySQL helper in
 `database/db.py` for credential validation and registration.
 
 Notes:
-- Replace placeholder database operations in AuthService with real
-  implementations as your schema evolves.
-- All network/DB calls should ideally be off the main thread for large apps;
-  kept simple here for clarity.
+- AuthService stores users in a `users` table, created on first connect.
+- Auth calls run on a small worker pool; results are marshalled back onto
+  the Tk event loop with `after()` so the UI stays responsive.
 """
 from __future__ import annotations
 
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Optional, Callable
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import ttk
+from typing import ClassVar, Optional, Callable
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
+
+try:
+    from ui.theme import (
+        ACCENT,
+        ACCENT_HOVER,
+        CARD_BG,
+        ERROR,
+        PRIMARY_BG,
+        SURFACE_BG,
+        TEXT_MUTED,
+        TEXT_PRIMARY,
+        get_font,
+    )
+except ImportError:  # run directly as a script from within ui/
+    from theme import (  # type: ignore
+        ACCENT,
+        ACCENT_HOVER,
+        CARD_BG,
+        ERROR,
+        PRIMARY_BG,
+        SURFACE_BG,
+        TEXT_MUTED,
+        TEXT_PRIMARY,
+        get_font,
+    )
 
 # Local database helper
 try:
@@ -22,36 +52,43 @@ try:
 except Exception:  # pragma: no cover - during design/mock
     DatabaseHelper = object  # type: ignore
 
+# Resolved once; False when running against the design-time fallback.
+_DB_HAS_CONNECT = hasattr(DatabaseHelper, "connect")
 
-# ----------------------------- Theme and Styles ----------------------------- #
-PRIMARY_BG = "#0F172A"       # slate-900
-SURFACE_BG = "#111827"       # gray-900
-CARD_BG = "#1F2937"          # gray-800
-ACCENT = "#22C55E"           # green-500
-ACCENT_HOVER = "#16A34A"     # green-600
-TEXT_PRIMARY = "#E5E7EB"     # gray-200
-TEXT_MUTED = "#9CA3AF"       # gray-400
-ERROR = "#EF4444"            # red-500
+# Worker threads for blocking DB/auth calls, kept off the Tk main thread.
+_AUTH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="auth")
 
+# ----------------------------- Theme and Styles ----------------------------- #
 FONT_TITLE = ("Segoe UI", 20, "bold")
 FONT_SUBTITLE = ("Segoe UI", 11)
 FONT_LABEL = ("Segoe UI", 10)
-FONT_INPUT = ("Segoe UI", 10)
 FONT_BUTTON = ("Segoe UI", 10, "bold")
 
+# ttk styles live in the Tcl interpreter, so configuring them once suffices.
+_STYLES_APPLIED = False
+
 
 def apply_styles(root: tk.Misc) -> None:
+    global _STYLES_APPLIED
+    if _STYLES_APPLIED:
+        return
+    _STYLES_APPLIED = True
+
     style = ttk.Style(root)
     try:
         style.theme_use("clam")
     except Exception:
         pass
+    font_title = get_font(root, FONT_TITLE)
+    font_subtitle = get_font(root, FONT_SUBTITLE)
+    font_label = get_font(root, FONT_LABEL)
+    font_button = get_font(root, FONT_BUTTON)
 
     style.configure("TFrame", background=SURFACE_BG)
     style.configure("Card.TFrame", background=CARD_BG)
-    style.configure("Title.TLabel", background=SURFACE_BG, foreground=TEXT_PRIMARY, font=FONT_TITLE)
-    style.configure("Muted.TLabel", background=SURFACE_BG, foreground=TEXT_MUTED, font=FONT_SUBTITLE)
-    style.configure("TLabel", background=SURFACE_BG, foreground=TEXT_PRIMARY, font=FONT_LABEL)
+    style.configure("Title.TLabel", background=SURFACE_BG, foreground=TEXT_PRIMARY, font=font_title)
+    style.configure("Muted.TLabel", background=SURFACE_BG, foreground=TEXT_MUTED, font=font_subtitle)
+    style.configure("TLabel", background=SURFACE_BG, foreground=TEXT_PRIMARY, font=font_label)
 
     style.configure(
         "TEntry",
@@ -69,7 +106,7 @@ def apply_styles(root: tk.Misc) -> None:
         "Accent.TButton",
         background=ACCENT,
         foreground="#0B1020",
-        font=FONT_BUTTON,
+        font=font_button,
         padding=(12, 8),
         borderwidth=0,
     )
@@ -82,7 +119,7 @@ def apply_styles(root: tk.Misc) -> None:
         "Ghost.TButton",
         background=CARD_BG,
         foreground=TEXT_PRIMARY,
-        font=FONT_BUTTON,
+        font=font_button,
         padding=(10, 6),
         borderwidth=0,
     )
@@ -90,43 +127,151 @@ def apply_styles(root: tk.Misc) -> None:
 
 
 # ---------------------------- Auth Service Layer ---------------------------- #
+USERS_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS users ("
+    " username VARCHAR(64) PRIMARY KEY,"
+    " password_hash VARCHAR(255) NOT NULL)"
+)
+USER_CACHE_SIZE = 128
+
+# Argon2id (C-backed). One verify takes on the order of 100-150 ms on a
+# typical desktop; lower time_cost/memory_cost if that is too slow.
+_PH = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+# Hash of a random, discarded password with the same parameters as _PH.
+# Verified against for unknown usernames so they cost the same as known ones.
+_DUMMY_HASH = (
+    "$argon2id$v=19$m=65536,t=2,p=1$gsMN7rYMN8u66jszdwlvWQ"
+    "$b+PWQZF6l/S42srBpQltVa/NGuYb9y3U7HTwp0cfz70"
+)
+
+
+def _dummy_verify(password: str) -> None:
+    try:
+        _PH.verify(_DUMMY_HASH, password)
+    except VerifyMismatchError:
+        pass
+
+
+class ServiceUnavailableError(Exception):
+    """Raised by AuthService when the database cannot be reached."""
+
+
 class AuthService:
     """Service that uses DatabaseHelper to validate and register users.
 
-    Replace bodies with real queries suited to your user table schema.
+    User records are cached by username (bounded LRU) so repeated sign-in
+    attempts skip the database round trip; writes invalidate the entry.
+    Methods may be called from worker threads; DB and cache access is
+    serialised by a lock. Use ``instance()`` to share one service
+    (and its cache and prepared statements) across windows.
     """
 
+    _inst: ClassVar[Optional["AuthService"]] = None
+
     def __init__(self, db: Optional[DatabaseHelper] = None):
         self.db = db or DatabaseHelper()
-
-    def ensure_ready(self) -> None:
+        self._user_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._ready = False
+
+    @classmethod
+    def instance(cls) -> "AuthService":
+        """Return the process-wide service.
+
+        No connection is made here, since this runs on the Tk thread; the
+        first auth call connects from a worker, and later calls retry if
+        that failed.
+        """
+        if cls._inst is None:
+            cls._inst = cls()
+        return cls._inst
+
+    def ensure_ready(self) -> bool:
+        if not _DB_HAS_CONNECT:
+            return False
         try:
-            if hasattr(self.db, "connect"):
-                self.db.connect()
-            # TODO: Create users table if not exists
+            # Reuse a connection left over from an earlier partial attempt
+            connected = self.db.connection is not None or self.db.connect()
+            self._ready = bool(
+                connected and self.db.execute(USERS_TABLE_SQL, prepared=False)
+            )
         except Exception as e:
             print(f"DB init error: {e}")
+            self._ready = False
+        return self._ready
+
+    def _fetch_user_record(self, username: str) -> Optional[str]:
+        """Return the stored password hash for a user, consulting the cache first."""
+        record = self._user_cache.get(username)
+        if record is not None:
+            self._user_cache.move_to_end(username)
+            return record
+        row = self.db.fetch_one(
+            "SELECT password_hash FROM users WHERE username = %s", (username,)
+        )
+        if row is None:
+            return None
+        record = row[0]
+        self._user_cache[username] = record
+        if len(self._user_cache) > USER_CACHE_SIZE:
+            self._user_cache.popitem(last=False)
+        return record
+
+    def _require_ready(self) -> None:
+        """Connect if needed; call with ``_lock`` held."""
+        if not self._ready and not self.ensure_ready():
+            raise ServiceUnavailableError("database unavailable")
 
     def validate_credentials(self, username: str, password: str) -> bool:
-        """Validate credentials against DB. TODO: Replace with hashing."""
+        """Validate credentials against the Argon2 hash stored in DB.
+
+        Raises ServiceUnavailableError if the database cannot be reached.
+        """
+        if not username or not password:
+            return False
         try:
-            return bool(username and password)
+            with self._lock:
+                self._require_ready()
+                record = self._fetch_user_record(username)
+            if record is None:
+                _dummy_verify(password)
+                return False
+            return _PH.verify(record, password)
+        except (VerifyMismatchError, InvalidHashError):
+            return False
+        except ServiceUnavailableError:
+            raise
         except Exception as e:
             print(f"Login validation error: {e}")
             return False
 
     def register_user(self, username: str, password: str) -> bool:
-        """Register a new user in DB. Use hashing + uniqueness checks."""
+        """Register a new user in DB. Fails if the username is taken.
+
+        Raises ServiceUnavailableError if the database cannot be reached.
+        """
         if not username or not password:
             return False
         try:
-            return True
+            password_hash = _PH.hash(password)
+            with self._lock:
+                self._require_ready()
+                self._user_cache.pop(username, None)
+                return bool(self.db.execute(
+                    "INSERT INTO users (username, password_hash) VALUES (%s, %s)",
+                    (username, password_hash),
+                ))
+        except ServiceUnavailableError:
+            raise
         except Exception as e:
             print(f"Registration error: {e}")
             return False
 
 
 # ---------------------------- Tkinter UI Windows ---------------------------- #
+SERVER_UNAVAILABLE_MSG = "Server unavailable. Please try again later."
+
 class AuthWindow:
     """Tkinter Toplevel providing Sign In and Sign Up views with styling."""
 
@@ -138,32 +283,33 @@ class AuthWindow:
         self.window.geometry("520x560")
         self.window.configure(bg=PRIMARY_BG)
         self.window.resizable(False, False)
-        self.window.grab_set()
 
         apply_styles(self.window)
-        self.auth = AuthService()
-        self.auth.ensure_ready()
+        self.auth = AuthService.instance()
 
         container = ttk.Frame(self.window, style="TFrame")
         container.pack(fill="both", expand=True, padx=24, pady=24)
 
-        card = ttk.Frame(container, style="Card.TFrame")
-        card.place(relx=0.5, rely=0.5, anchor="center", width=460, height=480)
+        card = ttk.Frame(container, style="Card.TFrame", width=460, height=480, padding=24)
+        card.pack(expand=True)
+        card.grid_propagate(False)
+        card.grid_columnconfigure(2, weight=1)
+        card.grid_rowconfigure(3, weight=1)
 
         header = ttk.Label(card, text="Hotel Management System", style="Title.TLabel")
-        header.place(x=24, y=24)
+        header.grid(row=0, column=0, columnspan=3, sticky="w")
         subtitle = ttk.Label(card, text="Welcome. Please sign in or create an account.", style="Muted.TLabel")
-        subtitle.place(x=24, y=64)
+        subtitle.grid(row=1, column=0, columnspan=3, sticky="w", pady=(8, 12))
 
-        self.btn_signin = ttk.Button(card, text="Sign In", style="Ghost.TButton", command=self.show_signin)
-        self.btn_signup = ttk.Button(card, text="Sign Up", style="Ghost.TButton", command=self.show_signup)
-        self.btn_signin.place(x=24, y=100, width=100)
-        self.btn_signup.place(x=134, y=100, width=100)
+        self.btn_signin = ttk.Button(card, text="Sign In", style="Ghost.TButton", width=10, command=self.show_signin)
+        self.btn_signup = ttk.Button(card, text="Sign Up", style="Ghost.TButton", width=10, command=self.show_signup)
+        self.btn_signin.grid(row=2, column=0, sticky="w")
+        self.btn_signup.grid(row=2, column=1, sticky="w", padx=(10, 0))
 
         self.frame_signin = ttk.Frame(card, style="Card.TFrame")
         self.frame_signup = ttk.Frame(card, style="Card.TFrame")
         for f in (self.frame_signin, self.frame_signup):
-            f.place(x=24, y=140, width=412, height=300)
+            f.grid(row=3, column=0, columnspan=3, sticky="nsew", pady=(16, 0))
 
         self._build_signin(self.frame_signin)
         self._build_signup(self.frame_signup)
@@ -181,26 +327,41 @@ class AuthWindow:
         self.si_pass = self._labeled_entry(parent, "Password", show="*")
         helper = ttk.Label(parent, text="Use your registered account to continue.", style="Muted.TLabel")
         helper.pack(anchor="w", pady=(0, 10))
-        btn = ttk.Button(parent, text="Sign In", style="Accent.TButton", command=self._handle_signin)
-        btn.pack(fill="x", pady=(6, 6))
+        self.si_button = ttk.Button(parent, text="Sign In", style="Accent.TButton", command=self._handle_signin)
+        self.si_button.pack(fill="x", pady=(6, 6))
+        self.si_status = ttk.Label(parent, text="", style="Muted.TLabel")
+        self.si_status.pack(anchor="w")
 
     def _build_signup(self, parent: tk.Misc) -> None:
         self.su_user = self._labeled_entry(parent, "Username")
         self.su_pass = self._labeled_entry(parent, "Password", show="*")
         self.su_confirm = self._labeled_entry(parent, "Confirm Password", show="*")
-        note = ttk.Label(parent, text="Password will be stored securely (hashing placeholder).", style="Muted.TLabel")
+        note = ttk.Label(parent, text="Passwords are stored as Argon2 hashes.", style="Muted.TLabel")
         note.pack(anchor="w", pady=(0, 10))
-        btn = ttk.Button(parent, text="Create Account", style="Accent.TButton", command=self._handle_signup)
-        btn.pack(fill="x", pady=(6, 6))
+        self.su_button = ttk.Button(parent, text="Create Account", style="Accent.TButton", command=self._handle_signup)
+        self.su_button.pack(fill="x", pady=(6, 6))
+        self.su_status = ttk.Label(parent, text="", style="Muted.TLabel")
+        self.su_status.pack(anchor="w")
+
+    def reset(self) -> None:
+        """Clear all form fields and return to the Sign In view."""
+        for entry in (self.si_user, self.si_pass, self.su_user, self.su_pass, self.su_confirm):
+            entry.delete(0, "end")
+        for status in (self.si_status, self.su_status):
+            self._set_status(status, "")
+        self.show_signin()
+
+    @staticmethod
+    def _set_status(label: ttk.Label, text: str, color: str = TEXT_MUTED) -> None:
+        """Show feedback inline instead of in a modal dialog."""
+        label.configure(text=text, foreground=color)
 
     def show_signin(self) -> None:
-        self.frame_signup.lower()
-        self.frame_signin.lift()
+        self.frame_signin.tkraise()
         self._highlight_tab(active="in")
 
     def show_signup(self) -> None:
-        self.frame_signin.lower()
-        self.frame_signup.lift()
+        self.frame_signup.tkraise()
         self._highlight_tab(active="up")
 
     def _highlight_tab(self, active: str) -> None:
@@ -215,37 +376,86 @@ class AuthWindow:
         username = self.si_user.get().strip()
         password = self.si_pass.get().strip()
         if not username or not password:
-            messagebox.showerror("Missing info", "Please enter both username and password.")
+            self._set_status(self.si_status, "Please enter both username and password.", ERROR)
             return
-        ok = self.auth.validate_credentials(username, password)
-        if ok:
-            messagebox.showinfo("Welcome", f"Signed in as {username}")
+        self._set_status(self.si_status, "Signing in...")
+        self.si_button.state(["disabled"])
+        fut = _AUTH_POOL.submit(self.auth.validate_credentials, username, password)
+        fut.add_done_callback(lambda f: self._dispatch(self._on_signin_result, username, f))
+
+    def _dispatch(self, callback: Callable[[str, Optional[bool]], None], username: str, fut: Future) -> None:
+        """Hand a finished auth future back to the Tk event loop.
+
+        The callback gets None when the database was unavailable.
+        """
+        result: Optional[bool]
+        try:
+            result = bool(fut.result())
+        except ServiceUnavailableError:
+            result = None
+        except Exception as e:
+            print(f"Auth worker error: {e}")
+            result = False
+        try:
+            self.window.after(0, callback, username, result)
+        except (RuntimeError, tk.TclError):
+            pass  # window closed while the worker was running
+
+    def _on_signin_result(self, username: str, ok: Optional[bool]) -> None:
+        self.si_button.state(["!disabled"])
+        if ok is None:
+            self._set_status(self.si_status, SERVER_UNAVAILABLE_MSG, ERROR)
+        elif ok:
+            self._set_status(self.si_status, f"Signed in as {username}", ACCENT)
             if self.on_success:
                 self.on_success(username)
-            self.window.destroy()
+            # Hidden rather than destroyed so open_auth_window can reuse it
+            self.window.grab_release()
+            self.window.withdraw()
         else:
-            messagebox.showerror("Authentication failed", "Invalid username or password.")
+            self._set_status(self.si_status, "Invalid username or password.", ERROR)
 
     def _handle_signup(self) -> None:
         username = self.su_user.get().strip()
         password = self.su_pass.get().strip()
         confirm = self.su_confirm.get().strip()
         if not username or not password:
-            messagebox.showerror("Missing info", "Please fill all required fields.")
+            self._set_status(self.su_status, "Please fill all required fields.", ERROR)
             return
         if password != confirm:
-            messagebox.showerror("Mismatch", "Passwords do not match.")
+            self._set_status(self.su_status, "Passwords do not match.", ERROR)
             return
-        created = self.auth.register_user(username, password)
-        if created:
-            messagebox.showinfo("Success", "Account created. You can now sign in.")
+        self._set_status(self.su_status, "Creating account...")
+        self.su_button.state(["disabled"])
+        fut = _AUTH_POOL.submit(self.auth.register_user, username, password)
+        fut.add_done_callback(lambda f: self._dispatch(self._on_signup_result, username, f))
+
+    def _on_signup_result(self, username: str, created: Optional[bool]) -> None:
+        self.su_button.state(["!disabled"])
+        if created is None:
+            self._set_status(self.su_status, SERVER_UNAVAILABLE_MSG, ERROR)
+        elif created:
+            self._set_status(self.su_status, "")
+            self._set_status(self.si_status, "Account created. You can now sign in.", ACCENT)
             self.show_signin()
         else:
-            messagebox.showerror("Could not create account", "Username may already exist or server error.")
+            self._set_status(self.su_status, "Username may already exist or server error.", ERROR)
+
+
+_cached_auth: Optional[AuthWindow] = None
 
 
 def open_auth_window(root: tk.Misc, on_success: Optional[Callable[[str], None]] = None) -> AuthWindow:
-    return AuthWindow(root, on_success=on_success)
+    """Show the auth window, reusing the hidden one from a previous session."""
+    global _cached_auth
+    if _cached_auth is not None and _cached_auth.window.winfo_exists():
+        _cached_auth.on_success = on_success
+        _cached_auth.reset()
+        _cached_auth.window.deiconify()
+    else:
+        _cached_auth = AuthWindow(root, on_success=on_success)
+    _cached_auth.window.grab_set()
+    return _cached_auth
 
 
 if __name__ == "__main__":
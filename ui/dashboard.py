@@ -9,37 +9,70 @@ Provides a comprehensive hotel management dashboard with navigation to:
 - Reports
 - Logout
 
-Matches the professional dark theme from auth.py.
+Shares the professional dark theme in theme.py with auth.py.
 """
 from __future__ import annotations
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 from typing import Optional, Callable
 
+try:
+    from ui.theme import (
+        ACCENT,
+        ACCENT_HOVER,
+        CARD_BG,
+        PRIMARY_BG,
+        SURFACE_BG,
+        TEXT_MUTED,
+        TEXT_PRIMARY,
+        get_font,
+    )
+except ImportError:  # run directly as a script from within ui/
+    from theme import (  # type: ignore
+        ACCENT,
+        ACCENT_HOVER,
+        CARD_BG,
+        PRIMARY_BG,
+        SURFACE_BG,
+        TEXT_MUTED,
+        TEXT_PRIMARY,
+        get_font,
+    )
+
 # ----------------------------- Theme and Styles ----------------------------- #
-PRIMARY_BG = "#0F172A"       # slate-900
-SURFACE_BG = "#111827"       # gray-900
-CARD_BG = "#1F2937"          # gray-800
-ACCENT = "#22C55E"           # green-500
-ACCENT_HOVER = "#16A34A"     # green-600
+# Shared palette comes from ui.theme; only dashboard-specific colours here.
 DANGER = "#EF4444"           # red-500
 DANGER_HOVER = "#DC2626"     # red-600
-TEXT_PRIMARY = "#E5E7EB"     # gray-200
-TEXT_MUTED = "#9CA3AF"       # gray-400
 
 FONT_TITLE = ("Segoe UI", 24, "bold")
 FONT_HEADING = ("Segoe UI", 16, "bold")
 FONT_LABEL = ("Segoe UI", 10)
 FONT_BUTTON = ("Segoe UI", 11, "bold")
 
+# ttk styles live in the Tcl interpreter, so configuring them once suffices.
+_STYLES_APPLIED = False
+
 
 def apply_dashboard_styles(root: tk.Misc) -> None:
-    """Apply consistent TTK styling for dashboard."""
+    """Apply consistent TTK styling for dashboard.
+
+    Style names are kept distinct from those in auth.py so that neither
+    module has to re-apply its styles after the other has run.
+    """
+    global _STYLES_APPLIED
+    if _STYLES_APPLIED:
+        return
+    _STYLES_APPLIED = True
+
     style = ttk.Style(root)
     try:
         style.theme_use("clam")
     except Exception:
         pass
+    font_title = get_font(root, FONT_TITLE)
+    font_heading = get_font(root, FONT_HEADING)
+    font_label = get_font(root, FONT_LABEL)
+    font_button = get_font(root, FONT_BUTTON)
 
     # Frame styles
     style.configure("TFrame", background=SURFACE_BG)
@@ -48,22 +81,22 @@ def apply_dashboard_styles(root: tk.Misc) -> None:
 
     # Label styles
     style.configure(
-        "Title.TLabel",
+        "Header.TLabel",
         background=PRIMARY_BG,
         foreground=TEXT_PRIMARY,
-        font=FONT_TITLE,
+        font=font_title,
     )
     style.configure(
         "Heading.TLabel",
         background=SURFACE_BG,
         foreground=TEXT_PRIMARY,
-        font=FONT_HEADING,
+        font=font_heading,
     )
     style.configure(
         "Info.TLabel",
         background=SURFACE_BG,
         foreground=TEXT_MUTED,
-        font=FONT_LABEL,
+        font=font_label,
     )
 
     # Button styles
@@ -71,7 +104,7 @@ def apply_dashboard_styles(root: tk.Misc) -> None:
         "Nav.TButton",
         background=CARD_BG,
         foreground=TEXT_PRIMARY,
-        font=FONT_BUTTON,
+        font=font_button,
         padding=(20, 15),
         borderwidth=0,
     )
@@ -81,15 +114,15 @@ def apply_dashboard_styles(root: tk.Misc) -> None:
     )
 
     style.configure(
-        "Accent.TButton",
+        "Action.TButton",
         background=ACCENT,
         foreground="#0B1020",
-        font=FONT_BUTTON,
+        font=font_button,
         padding=(16, 10),
         borderwidth=0,
     )
     style.map(
-        "Accent.TButton",
+        "Action.TButton",
         background=[("active", ACCENT_HOVER)],
     )
 
@@ -97,7 +130,7 @@ def apply_dashboard_styles(root: tk.Misc) -> None:
         "Danger.TButton",
         background=DANGER,
         foreground="white",
-        font=FONT_BUTTON,
+        font=font_button,
         padding=(12, 8),
         borderwidth=0,
     )
@@ -141,6 +174,7 @@ class Dashboard:
         # Build UI
         self._create_header()
         self._create_welcome_section()
+        self._create_status_bar()
         self._create_navigation_grid()
 
     def _create_header(self) -> None:
@@ -153,7 +187,7 @@ class Dashboard:
         title_label = ttk.Label(
             header_frame,
             text="Hotel Management System",
-            style="Title.TLabel",
+            style="Header.TLabel",
         )
         title_label.pack(side=tk.LEFT, padx=30, pady=20)
 
@@ -171,12 +205,12 @@ class Dashboard:
         welcome_frame = ttk.Frame(self.window, style="TFrame")
         welcome_frame.pack(fill=tk.X, padx=40, pady=(30, 20))
 
-        heading = ttk.Label(
+        self.heading = ttk.Label(
             welcome_frame,
             text=f"Welcome, {self.username}!",
             style="Heading.TLabel",
         )
-        heading.pack(anchor="w")
+        self.heading.pack(anchor="w")
 
         info = ttk.Label(
             welcome_frame,
@@ -185,6 +219,15 @@ class Dashboard:
         )
         info.pack(anchor="w", pady=(8, 0))
 
+    def _create_status_bar(self) -> None:
+        """Create bottom status bar used for inline feedback."""
+        self.status = ttk.Label(self.window, text="", style="Info.TLabel")
+        self.status.pack(fill=tk.X, side=tk.BOTTOM, padx=40, pady=(0, 20))
+
+    def _show_status(self, text: str) -> None:
+        """Show a message in the status bar instead of a modal dialog."""
+        self.status.configure(text=text)
+
     def _create_navigation_grid(self) -> None:
         """Create grid of navigation buttons for main features."""
         # Container for navigation buttons
@@ -201,23 +244,20 @@ class Dashboard:
             ("Reports", self._open_reports),
         ]
 
-        # Create 3x2 grid of navigation cards
+        # Create 3x2 grid of navigation buttons; Nav.TButton carries the
+        # card styling, so no wrapper frame is needed per item.
+        nav_container.grid_propagate(False)
         for idx, (label, command) in enumerate(nav_items):
             row = idx // 3
             col = idx % 3
 
-            # Card frame for each button
-            card = ttk.Frame(nav_container, style="Card.TFrame")
-            card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
-
-            # Navigation button
             btn = ttk.Button(
-                card,
+                nav_container,
                 text=label,
                 style="Nav.TButton",
                 command=command,
             )
-            btn.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+            btn.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
 
         # Configure grid weights for responsiveness
         for i in range(3):
@@ -225,71 +265,81 @@ class Dashboard:
         for i in range(2):
             nav_container.rowconfigure(i, weight=1, uniform="nav_row")
 
+        # Resolve geometry in a single pass once every slot is placed
+        nav_container.update_idletasks()
+
     # -------------------------- Navigation Handlers ------------------------- #
 
     def _open_room_management(self) -> None:
         """Open Room Management module (placeholder)."""
         print("[Dashboard] Room Management - Not yet implemented")
-        messagebox.showinfo(
-            "Room Management",
-            "Room Management module is under development.\nThis will allow you to:"
-            "\n• Add/edit/delete rooms\n• View room status\n• Set room rates",
+        self._show_status(
+            "Room Management module is under development. It will let you "
+            "add/edit/delete rooms, view room status, set room rates.",
         )
 
     def _open_bookings(self) -> None:
         """Open Bookings module (placeholder)."""
         print("[Dashboard] Bookings - Not yet implemented")
-        messagebox.showinfo(
-            "Bookings",
-            "Bookings module is under development.\nThis will allow you to:"
-            "\n• Create new bookings\n• View existing bookings\n• Modify/cancel bookings",
+        self._show_status(
+            "Bookings module is under development. It will let you "
+            "create new bookings, view existing bookings, modify/cancel bookings.",
         )
 
     def _open_guests(self) -> None:
         """Open Guests module (placeholder)."""
         print("[Dashboard] Guests - Not yet implemented")
-        messagebox.showinfo(
-            "Guests",
-            "Guests module is under development.\nThis will allow you to:"
-            "\n• Manage guest profiles\n• View guest history\n• Track preferences",
+        self._show_status(
+            "Guests module is under development. It will let you "
+            "manage guest profiles, view guest history, track preferences.",
         )
 
     def _open_staff(self) -> None:
         """Open Staff module (placeholder)."""
         print("[Dashboard] Staff - Not yet implemented")
-        messagebox.showinfo(
-            "Staff",
-            "Staff module is under development.\nThis will allow you to:"
-            "\n• Manage staff records\n• Assign roles\n• Track schedules",
+        self._show_status(
+            "Staff module is under development. It will let you "
+            "manage staff records, assign roles, track schedules.",
         )
 
     def _open_billing(self) -> None:
         """Open Billing module (placeholder)."""
         print("[Dashboard] Billing - Not yet implemented")
-        messagebox.showinfo(
-            "Billing",
-            "Billing module is under development.\nThis will allow you to:"
-            "\n• Generate invoices\n• Process payments\n• View transaction history",
+        self._show_status(
+            "Billing module is under development. It will let you "
+            "generate invoices, process payments, view transaction history.",
         )
 
     def _open_reports(self) -> None:
         """Open Reports module (placeholder)."""
         print("[Dashboard] Reports - Not yet implemented")
-        messagebox.showinfo(
-            "Reports",
-            "Reports module is under development.\nThis will allow you to:"
-            "\n• Generate occupancy reports\n• View revenue analytics\n• Export data",
+        self._show_status(
+            "Reports module is under development. It will let you "
+            "generate occupancy reports, view revenue analytics, export data.",
         )
 
+    def set_user(self, username: str) -> None:
+        """Update the displayed user when the window is reused."""
+        self.username = username
+        self.heading.configure(text=f"Welcome, {username}!")
+        self._show_status("")
+
     def _handle_logout(self) -> None:
-        """Handle logout action - calls callback and closes window."""
+        """Handle logout action - calls callback and hides window.
+
+        The window is withdrawn rather than destroyed so that the next
+        open_dashboard call can show it again without rebuilding it.
+        """
         print(f"[Dashboard] User '{self.username}' logging out")
         if self.on_logout:
             self.on_logout()
-        self.window.destroy()
+        self.window.withdraw()
 
 
 # ------------------------------ Public API ---------------------------------- #
+_cached_dashboard: Optional[Dashboard] = None
+
+
 def open_dashboard(
     root: tk.Misc,
     username: str = "User",
@@ -297,6 +347,9 @@ def open_dashboard(
 ) -> Dashboard:
     """Open the main dashboard window.
 
+    The window is built once per process; later calls show the hidden
+    instance again with the new user and logout callback.
+
     Args:
         root: Parent Tkinter widget
         username: Logged-in user's name
@@ -305,7 +358,14 @@ def open_dashboard(
     Returns:
         Dashboard instance
     """
-    return Dashboard(root, username=username, on_logout=on_logout)
+    global _cached_dashboard
+    if _cached_dashboard is not None and _cached_dashboard.window.winfo_exists():
+        _cached_dashboard.set_user(username)
+        _cached_dashboard.on_logout = on_logout
+        _cached_dashboard.window.deiconify()
+    else:
+        _cached_dashboard = Dashboard(root, username=username, on_logout=on_logout)
+    return _cached_dashboard
 
 
 if __name__ == "__main__":
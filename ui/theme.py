@@ -0,0 +1,35 @@
+"""Shared colour palette and font cache for the Tkinter UI modules.
+
+Kept free of database and auth imports so any window can use it.
+"""
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import font as tkfont
+from typing import Dict
+
+PRIMARY_BG = "#0F172A"       # slate-900
+SURFACE_BG = "#111827"       # gray-900
+CARD_BG = "#1F2937"          # gray-800
+ACCENT = "#22C55E"           # green-500
+ACCENT_HOVER = "#16A34A"     # green-600
+TEXT_PRIMARY = "#E5E7EB"     # gray-200
+TEXT_MUTED = "#9CA3AF"       # gray-400
+ERROR = "#EF4444"            # red-500
+
+# Named Tk fonts keyed by their tuple spec; created on first use.
+_FONTS: Dict[tuple, tkfont.Font] = {}
+
+
+def get_font(root: tk.Misc, spec: tuple) -> tkfont.Font:
+    """Return a shared Tk font for a ``(family, size[, weight])`` tuple.
+
+    Needs an existing Tk root. The returned object must stay referenced
+    for the named font to live, which the module-level cache ensures.
+    """
+    font = _FONTS.get(spec)
+    if font is None:
+        family, size, *rest = spec
+        font = tkfont.Font(root=root, family=family, size=size, weight=rest[0] if rest else "normal")
+        _FONTS[spec] = font
+    return font